@@ -2,30 +2,106 @@
 Breaking Change Detection Tests
 Tests the BreakingChangeDetector by comparing two versions of the Users API
 """
+import re
 import pytest
-from pathlib import Path
+import yaml
 from utils.breaking_change_detector import BreakingChangeDetector
 
+# Common breaking change categories expected between v1 and v2
+EXPECTED_BREAKING_CATEGORIES = frozenset({
+    'field_removed', 'type_changed', 'endpoint_removed', 'response_code_changed'
+})
+
+# Words a critical change's impact should mention
+IMPACT_TRIGGER_RE = re.compile(r"break|fail|error", re.IGNORECASE)
+
+# Spec pair where whole 'properties'/'required' containers appear or disappear
+EDGE_CASE_OLD_SCHEMAS = {
+    'A': {'type': 'object', 'properties': {
+        'id': {'type': 'integer'},
+        'tags': {'type': 'array', 'items': {'type': 'string'}}
+    }},
+    'B': {'type': 'object', 'required': ['x'], 'properties': {'x': {'type': 'string'}}},
+    'C': {'type': 'object', 'properties': {'q': {'type': 'string'}}},
+    'D': {'type': 'object'},
+    'E': {'type': 'object', 'properties': {'e': {'type': 'string'}}},
+    'F': {'type': 'object'},
+    'G': {'type': 'object', 'properties': {'a': {'type': 'string'}}},
+    'H': {'type': 'object', 'required': ['a', 'b']},
+    'I': {'type': 'object', 'required': ['a']},
+    'J': {'type': 'object', 'required': ['a', 'b', 'c']}
+}
+
+EDGE_CASE_NEW_SCHEMAS = {
+    'A': {'type': 'object', 'properties': {
+        'id': {'type': 'string'},
+        'tags': {'type': 'array', 'items': {'type': 'integer'}}
+    }},
+    'B': {'type': 'object', 'properties': {'x': {'type': 'string'}}},
+    'C': {'type': 'object'},
+    'D': {'type': 'array', 'items': {'type': 'string'}},
+    'E': {'type': 'object', 'required': ['e'], 'properties': {'e': {'type': 'string'}}},
+    'G': {'type': 'object', 'properties': {'b': {'type': 'string'}}},  # renamed field
+    'H': {'type': 'object', 'required': ['a', 'c']},  # swapped entry
+    'I': {'type': 'object', 'required': ['b']},
+    'J': {'type': 'object', 'required': ['d', 'e', 'f']}  # replaced list
+}
+
+# (category, severity, path, description) reported by the built-in detectors
+EDGE_CASE_CHANGES = [
+    ('field_removed', 'critical', 'schemas/C.q', "Field 'q' removed from C"),
+    ('field_removed', 'critical', 'schemas/G.a', "Field 'a' removed from G"),
+    ('required_field_added', 'high', 'schemas/E.required', "Field 'e' is now required in E"),
+    ('required_field_added', 'high', 'schemas/H.required', "Field 'c' is now required in H"),
+    ('required_field_added', 'high', 'schemas/I.required', "Field 'b' is now required in I"),
+    ('required_field_added', 'high', 'schemas/J.required', "Field 'd' is now required in J"),
+    ('required_field_added', 'high', 'schemas/J.required', "Field 'e' is now required in J"),
+    ('required_field_added', 'high', 'schemas/J.required', "Field 'f' is now required in J"),
+    ('required_field_removed', 'medium', 'schemas/B.required', "Field 'x' is no longer required in B"),
+    ('required_field_removed', 'medium', 'schemas/H.required', "Field 'b' is no longer required in H"),
+    ('required_field_removed', 'medium', 'schemas/I.required', "Field 'a' is no longer required in I"),
+    ('required_field_removed', 'medium', 'schemas/J.required', "Field 'a' is no longer required in J"),
+    ('required_field_removed', 'medium', 'schemas/J.required', "Field 'b' is no longer required in J"),
+    ('required_field_removed', 'medium', 'schemas/J.required', "Field 'c' is no longer required in J"),
+    ('schema_removed', 'critical', 'schemas/F', "Schema 'F' was removed"),
+    ('type_changed', 'critical', 'schemas/A.id', "Field 'id' type changed from integer to string"),
+]
+
+# Nested type changes only DeepDiff reaches
+EDGE_CASE_NESTED_CHANGES = [
+    ('type_changed', 'critical', 'schemas/A.tags.items', "'A.tags.items' type changed from string to integer"),
+    ('type_changed', 'critical', 'schemas/D', "Schema 'D' type changed from object to array"),
+]
+
+
+def change_keys(changes):
+    """Sorted (category, severity, path, description) tuples, ignoring order"""
+    return sorted((c.category, c.severity, c.path, c.description) for c in changes)
+
+
+def write_spec(directory, name, schemas=None, paths=None):
+    """Write a minimal OpenAPI spec to directory and return its path"""
+    spec_path = directory / f'{name}.yaml'
+    spec_path.write_text(yaml.safe_dump({
+        'openapi': '3.0.3',
+        'info': {'title': 'Edge Case API', 'version': '1.0.0'},
+        'paths': paths or {},
+        'components': {'schemas': schemas or {}}
+    }, sort_keys=False))
+    return str(spec_path)
+
+
+@pytest.fixture
+def edge_case_spec_paths(tmp_path):
+    """(old, new) spec paths for the edge-case schema pair"""
+    return (write_spec(tmp_path, 'old', EDGE_CASE_OLD_SCHEMAS),
+            write_spec(tmp_path, 'new', EDGE_CASE_NEW_SCHEMAS))
+
 class TestBreakingChangeDetection:
     """
     Validate that breaking changes are correctly detected between API versions.
     """
     
-    @pytest.fixture
-    def v1_spec_path(self):
-        """Path to v1 (old) OpenAPI spec"""
-        return "contracts/openapi-specs/users-api-v1.yaml"
-    
-    @pytest.fixture
-    def v2_spec_path(self):
-        """Path to v2 (new) OpenAPI spec"""
-        return "contracts/openapi-specs/users-api-v2.yaml"
-    
-    @pytest.fixture
-    def detector(self, v1_spec_path, v2_spec_path):
-        """Initialize detector with v1 and v2 specs"""
-        return BreakingChangeDetector(v1_spec_path, v2_spec_path)
-
     def test_detector_initialization(self, detector):
         """Test: Detector initializes correctly with both specs"""
         assert detector.old_spec is not None
@@ -34,7 +110,7 @@ class TestBreakingChangeDetection:
         assert detector.new_spec['info']['version'] == '2.0.0'
         print("\nDetector: Initialized successfully with v1 and v2")
 
-    def test_detect_all_breaking_changes(self, detector):
+    def test_detect_all_breaking_changes(self, detector, verbose):
         """
         Test: All breaking changes are detected
         
@@ -50,19 +126,20 @@ class TestBreakingChangeDetection:
         assert summary['total'] > 0, "No breaking changes detected between v1 and v2"
         
         # Log detected changes for visibility
-        for change in changes:
-            print(f"  - [{change.severity.upper()}] {change.category}: {change.description} at {change.path}")
+        if verbose:
+            for change in changes:
+                print(f"  - [{change.severity.upper()}] {change.category}: {change.description} at {change.path}")
 
     def test_specific_breaking_changes(self, detector):
         """
         Test: Specific types of breaking changes are detected
         """
         changes = detector.detect_all_changes()
-        categories = [c.category for c in changes]
+        categories = {c.category for c in changes}
         
         # Check for expected categories of changes between v1 and v2
         # (Based on common breaking change scenarios)
-        assert any(cat in categories for cat in ['field_removed', 'type_changed', 'endpoint_removed', 'response_code_changed']), \
+        assert categories & EXPECTED_BREAKING_CATEGORIES, \
             "Expected common breaking change categories not found"
 
     def test_critical_changes_impact(self, detector):
@@ -74,8 +151,7 @@ class TestBreakingChangeDetection:
         
         for change in critical_changes:
             assert change.impact != "", f"Critical change {change.category} missing impact description"
-            impact_lower = change.impact.lower()
-            assert any(word in impact_lower for word in ["break", "fail", "error"]), \
+            assert IMPACT_TRIGGER_RE.search(change.impact), \
                 f"Impact description for {change.category} should mention breakage or errors: '{change.impact}'"
 
     def test_no_changes_same_file(self, v1_spec_path):
@@ -86,4 +162,72 @@ class TestBreakingChangeDetection:
         changes = detector_same.detect_all_changes()
         
         assert len(changes) == 0, "Breaking changes detected when comparing identical specs"
-        print("\nRegression Check: No changes detected for identical specs")
\ No newline at end of file
+        print("\nRegression Check: No changes detected for identical specs")
+
+    def test_batch_detection_matches_single(self, v1_spec_path, v2_spec_path, detector):
+        """
+        Test: Batch detection across spec pairs matches per-pair detection
+        """
+        pairs = [(v1_spec_path, v2_spec_path), (v1_spec_path, v1_spec_path)]
+        
+        results = BreakingChangeDetector.detect_all_changes_batch(pairs, workers=2)
+        
+        assert set(results) == set(pairs)
+        assert (change_keys(results[(v1_spec_path, v2_spec_path)])
+                == change_keys(detector.detect_all_changes()))
+        assert results[(v1_spec_path, v1_spec_path)] == []
+        
+        print(f"\nBatch Detection: {len(pairs)} spec pairs compared in parallel")
+
+    def test_deepdiff_detection_matches_builtin(self, v1_spec_path, v2_spec_path, detector):
+        """
+        Test: DeepDiff-backed detection finds the same changes as the built-in detectors
+        """
+        pytest.importorskip("deepdiff")
+        
+        deepdiff_detector = BreakingChangeDetector(v1_spec_path, v2_spec_path, use_deepdiff=True)
+        
+        assert deepdiff_detector.use_deepdiff
+        assert (change_keys(deepdiff_detector.detect_all_changes())
+                == change_keys(detector.detect_all_changes()))
+        
+        print("\nDeepDiff Detection: matches built-in detectors")
+
+    def test_builtin_detection_edge_cases(self, edge_case_spec_paths):
+        """
+        Test: Built-in detectors report removed/added properties and required containers
+        """
+        edge_detector = BreakingChangeDetector(*edge_case_spec_paths)
+        
+        assert change_keys(edge_detector.detect_all_changes()) == sorted(EDGE_CASE_CHANGES)
+
+    def test_deepdiff_detection_edge_cases(self, edge_case_spec_paths):
+        """
+        Test: DeepDiff-backed detection reports every built-in change plus nested type changes
+        """
+        pytest.importorskip("deepdiff")
+        
+        deepdiff_detector = BreakingChangeDetector(*edge_case_spec_paths, use_deepdiff=True)
+        
+        assert (change_keys(deepdiff_detector.detect_all_changes())
+                == sorted(EDGE_CASE_CHANGES + EDGE_CASE_NESTED_CHANGES))
+        
+        print("\nDeepDiff Detection: container and nested changes reported")
+
+    def test_endpoint_changes_in_method_order(self, tmp_path):
+        """
+        Test: Endpoint changes are reported in get/post/put/delete/patch order, not spec order
+        """
+        def operation(code):
+            return {'responses': {code: {'description': 'OK'}}}
+        
+        old_paths = {'/items': {'patch': operation('200'), 'delete': operation('204'),
+                                'post': operation('201'), 'get': operation('200')}}
+        new_paths = {'/items': {'post': operation('200'), 'get': operation('200')}}
+        
+        order_detector = BreakingChangeDetector(write_spec(tmp_path, 'old', paths=old_paths),
+                                                write_spec(tmp_path, 'new', paths=new_paths))
+        
+        assert [c.path for c in order_detector.detect_response_changes()] == [
+            'POST /items', 'DELETE /items', 'PATCH /items'
+        ]
@@ -4,7 +4,11 @@ HTML report customization and global fixtures
 """
 import pytest
 import sys
+import yaml
 from datetime import datetime
+from pathlib import Path
+from utils.openapi_loader import OpenAPILoader
+from utils.breaking_change_detector import BreakingChangeDetector
 
 
 # ============================================
@@ -66,4 +70,53 @@ def pytest_html_results_summary(prefix, summary, postfix):
 @pytest.fixture(scope='session')
 def api_base_url():
     """Base URL for API testing"""
-    return "https://jsonplaceholder.typicode.com"
\ No newline at end of file
+    return "https://jsonplaceholder.typicode.com"
+
+
+@pytest.fixture(scope='session')
+def verbose(request):
+    """True when per-item detail output is requested (pytest -vv)"""
+    return request.config.getoption('verbose') >= 2
+
+
+# ============================================
+# Spec Fixtures (session-scoped: parsed once per run, or per xdist worker)
+# ============================================
+
+@pytest.fixture(scope='session')
+def users_api_spec_path():
+    """Path to Users API OpenAPI spec"""
+    return Path("contracts/openapi-specs/users-api-v1.yaml")
+
+
+@pytest.fixture(scope='session')
+def parsed_spec(users_api_spec_path):
+    """Users API spec, parsed once and shared by every test (read-only)"""
+    try:
+        return OpenAPILoader(users_api_spec_path).get_spec()
+    except yaml.YAMLError as e:
+        pytest.fail(f"Invalid YAML syntax: {e}")
+
+
+@pytest.fixture(scope='session')
+def openapi_loader():
+    """Load OpenAPI spec"""
+    return OpenAPILoader('contracts/openapi-specs/users-api-v1.yaml')
+
+
+@pytest.fixture(scope='session')
+def v1_spec_path():
+    """Path to v1 (old) OpenAPI spec"""
+    return "contracts/openapi-specs/users-api-v1.yaml"
+
+
+@pytest.fixture(scope='session')
+def v2_spec_path():
+    """Path to v2 (new) OpenAPI spec"""
+    return "contracts/openapi-specs/users-api-v2.yaml"
+
+
+@pytest.fixture(scope='session')
+def detector(v1_spec_path, v2_spec_path):
+    """Initialize detector with v1 and v2 specs"""
+    return BreakingChangeDetector(v1_spec_path, v2_spec_path)
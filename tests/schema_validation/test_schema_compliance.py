@@ -6,14 +6,9 @@ Tests that the implementation (API) follows the contract (OpenAPI spec)
 """
 import pytest
 import requests
-from utils.openapi_loader import OpenAPILoader
+from requests.adapters import HTTPAdapter
 from utils.schema_validator import SchemaValidator
 
-@pytest.fixture(scope='session')
-def openapi_loader():
-    """Load OpenAPI spec"""
-    return OpenAPILoader('contracts/openapi-specs/users-api-v1.yaml')
-
 @pytest.fixture(scope='session')
 def base_url(openapi_loader):
     """Get base URL from OpenAPI spec"""
@@ -24,13 +19,52 @@ def schema_validator():
     """Schema validator fixture"""
     return SchemaValidator()
 
+@pytest.fixture(scope='class')
+def user_schema(openapi_loader):
+    """User schema as defined in the spec"""
+    return openapi_loader.get_schema('User')
+
+@pytest.fixture(scope='class')
+def resolved_user_schema(openapi_loader):
+    """User schema with $refs resolved"""
+    return openapi_loader.get_resolved_schema('User')
+
+@pytest.fixture(scope='class')
+def validate_user(schema_validator, resolved_user_schema):
+    """Compiled validator for a single User object"""
+    return schema_validator.compile(resolved_user_schema)
+
+@pytest.fixture(scope='class')
+def validate_users(schema_validator, resolved_user_schema):
+    """Compiled validator for a list of User objects"""
+    return schema_validator.compile({'type': 'array', 'items': resolved_user_schema})
+
+@pytest.fixture(scope='class')
+def http():
+    """Shared HTTP session (keep-alive + connection pooling)"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    yield session
+    session.close()
+
+@pytest.fixture(scope='class')
+def user_one_response(http, base_url):
+    """GET /users/1 response, fetched once per class"""
+    return http.get(f"{base_url}/users/1")
+
+@pytest.fixture(scope='class')
+def user_one(user_one_response):
+    """GET /users/1 response body"""
+    return user_one_response.json()
+
+@pytest.mark.xdist_group("http")
 class TestSchemaCompliance:
     """
     Validate API responses against OpenAPI schemas.
     
     Purpose: Ensure API implementation matches contract
     """
-    def test_get_users_response_matches_schema(self, base_url, 
+    def test_get_users_response_matches_schema(self, user_one_response, 
                                            openapi_loader, 
                                            schema_validator):
         """
@@ -45,12 +79,12 @@ class TestSchemaCompliance:
         # Get expected schema
         response_schema = openapi_loader.get_response_schema('/users/{id}', 'get')
     
-        # Resolve $ref to actual User schema
-        user_schema = openapi_loader.resolve_schema_ref(response_schema)
+        # Resolve $refs to the actual (fully inlined) User schema
+        user_schema = openapi_loader.resolve_refs(response_schema)
     
         # Call API with specific user ID
         user_id = 1
-        response = requests.get(f"{base_url}/users/{user_id}")
+        response = user_one_response
     
         assert response.status_code == 200, \
             f"Expected 200, got {response.status_code}"
@@ -62,11 +96,8 @@ class TestSchemaCompliance:
         print(f"   User: {data.get('name', 'N/A')}")
         print(f"   Email: {data.get('email', 'N/A')}")
     
-        # Get full spec for $ref resolution
-        full_spec = openapi_loader.get_spec()
-    
         # Validate response matches schema
-        errors = schema_validator.validate(data, user_schema, full_spec=full_spec)
+        errors = schema_validator.validate(data, user_schema)
     
         if errors:
             print(f"\nSCHEMA VIOLATIONS:")
@@ -79,7 +110,7 @@ class TestSchemaCompliance:
         print(f"\nSchema Compliance: User object matches spec")
 
     
-    def test_user_required_fields_present(self, base_url, openapi_loader):
+    def test_user_required_fields_present(self, user_one, user_schema, verbose):
         """
         Test: User response contains all required fields
         
@@ -89,24 +120,20 @@ class TestSchemaCompliance:
         - email (string, format: email)
         - username (string)
         """
-        # Get User schema
-        user_schema = openapi_loader.get_schema('User')
         required_fields = user_schema.get('required', [])
 
         # Get user from API
-        response = requests.get(f"{base_url}/users/1")
-        data = response.json()
+        data = user_one
 
         print(f"\n[Required Fields Check]")
         print(f"   Required by spec: {required_fields}")
 
-        missing_fields = []
+        missing_fields = sorted(frozenset(required_fields) - data.keys())
 
-        for field in required_fields:
-            if field not in data:
-                missing_fields.append(field)
-            else:
-                print(f"   {field}: {data[field]}")
+        if verbose:
+            for field in required_fields:
+                if field in data:
+                    print(f"   {field}: {data[field]}")
 
         if missing_fields:
             print(f"   MISSING REQUIRED FIELDS:")
@@ -119,7 +146,8 @@ class TestSchemaCompliance:
 
         print(f"\nRequired Fields: All required fields present")
 
-    def test_user_field_types_correct(self, base_url, openapi_loader, schema_validator):
+    def test_user_field_types_correct(self, user_one, user_schema, schema_validator,
+                                      verbose):
         """
         Test: User field types match OpenAPI spec
         
@@ -129,12 +157,8 @@ class TestSchemaCompliance:
         - email: string
         - username: string
         """
-        # Get User schema
-        user_schema = openapi_loader.get_schema('User')
-
         # Get user from API
-        response = requests.get(f"{base_url}/users/1")
-        data = response.json()
+        data = user_one
 
         print(f"\n[Type Validation]")
 
@@ -146,20 +170,21 @@ class TestSchemaCompliance:
             for error in type_errors:
                 print(f"  - {error}")
 
-        else:
+        elif verbose:
             # Show correct types
             properties = user_schema.get('properties', {})
-            for field, field_schema in properties.items():
-                if field in data:
-                   expected_type = field_schema.get('type', 'any')
-                   actual_value = data[field]
-                   print(f"   {field}: {expected_type} = {actual_value}")
+            print("\n".join(
+                f"   {field}: {field_schema.get('type', 'any')} = {data[field]}"
+                for field, field_schema in properties.items()
+                if field in data
+            ))
+
+        assert len(type_errors) == 0, \
+            f"Type validation failed: {type_errors}"
 
-            assert len(type_errors) == 0, \
-                f"Type validation failed: {type_errors}"
+        print(f"\nAll field types correct")
 
-            print(f"\nAll field types correct")
-    def test_email_format_validation(self, base_url, schema_validator):
+    def test_email_format_validation(self, user_one, schema_validator):
         """
         Test: Email field follows email format
         
@@ -169,8 +194,7 @@ class TestSchemaCompliance:
         
         Validates RFC-compliant email format
         """
-        response = requests.get(f"{base_url}/users/1")
-        data = response.json()
+        data = user_one
         
         email = data.get('email')
         
@@ -188,43 +212,40 @@ class TestSchemaCompliance:
             f"Email format invalid: {email}"
     
     
-    def test_multiple_users_all_comply(self, base_url, 
-                                  openapi_loader, 
-                                  schema_validator):
+    def test_multiple_users_all_comply(self, http, base_url, 
+                                  validate_users, 
+                                  validate_user):
         """
         Test: All users in GET /users comply with schema
         
         Validates every user object in the array
         """
-        # Get User schema
-        user_schema = openapi_loader.get_schema('User')
-    
-        # Get full spec for $ref resolution
-        full_spec = openapi_loader.get_spec()
-    
         # Get all users
-        response = requests.get(f"{base_url}/users")
+        response = http.get(f"{base_url}/users")
         users = response.json()
     
         print(f"\n[Bulk Validation] Testing {len(users)} users")
     
         violations = []
     
-        for user in users:
-            errors = schema_validator.validate(user, user_schema, full_spec=full_spec)
-        
-        if errors:
-            violations.append({
-                'user_id': user.get('id', 'unknown'),
-                'errors': errors
-            })
+        # Validate the whole list in a single call
+        if validate_users(users):
+            # Attribute errors to individual users
+            for user in users:
+                errors = validate_user(user)
+            
+                if errors:
+                    violations.append({
+                        'user_id': user.get('id', 'unknown'),
+                        'errors': errors
+                    })
     
         if violations:
-            print(f"\nVIOLATIONS FOUND:")
+            lines = ["\nVIOLATIONS FOUND:"]
             for v in violations:
-                print(f"\n   User ID {v['user_id']}:")
-                for error in v['errors']:
-                    print(f"      - {error}")
+                lines.append(f"\n   User ID {v['user_id']}:")
+                lines.extend(f"      - {error}" for error in v['errors'])
+            print("\n".join(lines))
     
         assert len(violations) == 0, \
             f"{len(violations)} users have schema violations"
@@ -232,7 +253,7 @@ class TestSchemaCompliance:
         print(f"\nAll {len(users)} users comply with schema")
     
     
-    def test_optional_fields_when_present(self, base_url, openapi_loader):
+    def test_optional_fields_when_present(self, user_one, user_schema, verbose):
         """
         Test: Optional fields (when present) match schema types
         
@@ -242,7 +263,6 @@ class TestSchemaCompliance:
         - address: object
         - company: object
         """
-        user_schema = openapi_loader.get_schema('User')
         properties = user_schema.get('properties', {})
         required = user_schema.get('required', [])
         
@@ -252,18 +272,17 @@ class TestSchemaCompliance:
             if field not in required
         ]
         
-        response = requests.get(f"{base_url}/users/1")
-        data = response.json()
+        data = user_one
         
         print(f"\n[Optional Fields]")
         print(f"   Optional fields defined: {len(optional_fields)}")
         
-        for field in optional_fields:
-            if field in data:
-                value = data[field]
-                field_type = properties[field].get('type', 'any')
-                print(f"   {field} ({field_type}): present")
-            else:
-                print(f"   {field}: not present (OK - optional)")
+        if verbose:
+            print("\n".join(
+                f"   {field} ({properties[field].get('type', 'any')}): present"
+                if field in data else
+                f"   {field}: not present (OK - optional)"
+                for field in optional_fields
+            ))
         
         print(f"\nOptional fields handled correctly")
\ No newline at end of file
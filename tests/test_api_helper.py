@@ -9,6 +9,7 @@ from utils.api_helper import APIHelper
 from utils.api_logger import logger
 
 
+@pytest.mark.xdist_group("http")
 class TestAPIHelper:
     """API Helper tests with CRUD operations"""
     
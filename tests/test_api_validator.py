@@ -4,9 +4,11 @@ Tests demonstrating APIValidator class usage
 
 Uses JSONPlaceholder API for testing
 """
+import pytest
 import requests
 from utils.api_validator import APIValidator
 
+@pytest.mark.xdist_group("http")
 class TestAPIValidator:
     """
     API Validator tests.
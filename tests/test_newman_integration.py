@@ -9,6 +9,7 @@ import subprocess
 import json
 from pathlib import Path
 
+@pytest.mark.xdist_group("http")
 class TestNewmanIntegration:
     """
     Execute Postman collections with Newman.
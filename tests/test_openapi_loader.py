@@ -0,0 +1,98 @@
+"""
+OpenAPI Loader Tests
+Tests $ref resolution in OpenAPILoader
+
+Uses small specs written to a temporary directory
+"""
+import pytest
+import yaml
+from utils.openapi_loader import OpenAPILoader
+from utils.schema_validator import SchemaValidator
+
+REF_SPEC = {
+    'openapi': '3.0.3',
+    'info': {'title': 'Ref Test API', 'version': '1.0.0'},
+    'paths': {},
+    'components': {
+        'schemas': {
+            # $ref chain: Alias -> Tag -> definition
+            'Alias': {'$ref': '#/components/schemas/Tag'},
+            'Tag': {
+                'type': 'object',
+                'required': ['label'],
+                'properties': {'label': {'type': 'string'}}
+            },
+            'Post': {
+                'type': 'object',
+                'properties': {
+                    'tag': {'$ref': '#/components/schemas/Alias'},
+                    'tags': {'type': 'array', 'items': {'$ref': '#/components/schemas/Tag'}}
+                }
+            },
+            # Self-referencing schema
+            'Node': {
+                'type': 'object',
+                'properties': {
+                    'children': {'type': 'array', 'items': {'$ref': '#/components/schemas/Node'}}
+                }
+            }
+        }
+    }
+}
+
+
+class TestOpenAPILoader:
+    """OpenAPILoader $ref resolution tests"""
+
+    @pytest.fixture
+    def loader(self, tmp_path):
+        """Loader for a spec with a $ref chain and a recursive schema"""
+        spec_path = tmp_path / 'ref-spec.yaml'
+        spec_path.write_text(yaml.safe_dump(REF_SPEC))
+        return OpenAPILoader(spec_path)
+
+    def test_ref_chain_resolved(self, loader):
+        """Test: $ref chain (Alias -> Tag) is inlined to the final definition"""
+        resolved = loader.get_resolved_schema('Post')
+
+        tag_schema = REF_SPEC['components']['schemas']['Tag']
+        assert resolved['properties']['tag'] == tag_schema
+        assert resolved['properties']['tags']['items'] == tag_schema
+        assert loader.get_resolved_schema('Alias') == tag_schema
+        print("Test passed: $ref chain resolved")
+
+    def test_resolved_schema_validates_without_full_spec(self, loader):
+        """Test: resolved schema validates on its own"""
+        schema = loader.get_resolved_schema('Post')
+        validator = SchemaValidator()
+
+        assert validator.validate({'tag': {'label': 'news'}, 'tags': []}, schema) == []
+        assert validator.validate({'tag': {}, 'tags': [{'label': 1}]}, schema)
+        print("Test passed: resolved schema validates without full_spec")
+
+    def test_resolved_schema_is_cached(self, loader):
+        """Test: each schema is resolved once per loader"""
+        assert loader.get_resolved_schema('Post') is loader.get_resolved_schema('Post')
+
+    def test_recursive_schema_raises(self, loader):
+        """Test: recursive schema raises a clear error instead of leaving a $ref"""
+        with pytest.raises(ValueError, match=r"'Node' is recursive \(Node -> Node\)"):
+            loader.get_resolved_schema('Node')
+
+        with pytest.raises(ValueError, match="recursive"):
+            loader.resolve_refs({'$ref': '#/components/schemas/Node'})
+
+        print("Test passed: recursive schema rejected")
+
+    def test_recursive_schema_validates_with_full_spec(self, loader):
+        """Test: recursive schema validates when $refs resolve against full_spec"""
+        schema = loader.get_schema('Node')
+        full_spec = loader.get_spec()
+        validator = SchemaValidator()
+
+        valid = {'children': [{'children': []}]}
+        invalid = {'children': [{'children': 'none'}]}
+
+        assert validator.validate(valid, schema, full_spec=full_spec) == []
+        assert validator.validate(invalid, schema, full_spec=full_spec)
+        print("Test passed: recursive schema validated with full_spec")
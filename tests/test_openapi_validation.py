@@ -5,10 +5,65 @@ Validate that OpenAPI spec is valid and well-formed
 Tests that the contract itself is correct before testing implementations
 """
 import pytest
-import yaml
-from pathlib import Path
 from openapi_spec_validator import validate
-from openapi_spec_validator.readers import read_from_filename
+from openapi_spec_validator.shortcuts import get_validator_cls
+
+# Valid HTTP methods in OpenAPI
+HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch', 'options', 'head'})
+
+# Methods whose operations must define responses
+RESPONSE_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+
+@pytest.fixture(scope='session')
+def spec_validator_cls(parsed_spec):
+    """OpenAPI validator class for the spec version, detected once"""
+    return get_validator_cls(parsed_spec)
+
+@pytest.fixture(scope='session')
+def component_schemas(parsed_spec):
+    """components/schemas section of the spec"""
+    return parsed_spec.get('components', {}).get('schemas') or {}
+
+@pytest.fixture(scope='session')
+def spec_defects(parsed_spec, component_schemas):
+    """
+    Walk the spec once and collect structural defects.
+    
+    Returns:
+        Dict with 'paths_without_operations', 'operations_without_responses'
+        and 'schema_issues' lists
+    """
+    paths_without_operations = []
+    operations_without_responses = []
+    
+    for path, operations in parsed_spec.get('paths', {}).items():
+        if operations.keys().isdisjoint(HTTP_METHODS):
+            paths_without_operations.append(path)
+        
+        # Only visit methods the path defines, in spec order
+        for method in [key for key in operations if key in RESPONSE_METHODS]:
+            operation = operations[method]
+            
+            if 'responses' not in operation:
+                operations_without_responses.append(f"{method.upper()} {path}")
+            elif len(operation['responses']) == 0:
+                operations_without_responses.append(f"{method.upper()} {path} (empty)")
+    
+    schema_issues = [
+        f"{schema_name}: Missing 'type' field"
+        for schema_name, schema_def in component_schemas.items()
+        if 'type' not in schema_def and '$ref' not in schema_def
+    ] + [
+        f"{schema_name}: Object without 'properties'"
+        for schema_name, schema_def in component_schemas.items()
+        if schema_def.get('type') == 'object' and 'properties' not in schema_def
+    ]
+    
+    return {
+        'paths_without_operations': paths_without_operations,
+        'operations_without_responses': operations_without_responses,
+        'schema_issues': schema_issues
+    }
 
 class TestOpenAPISpecValidation:
     """
@@ -17,11 +72,6 @@ class TestOpenAPISpecValidation:
     Purpose: Ensure the contract (OpenAPI spec) is valid
     before testing API implementations against it.
     """
-    @pytest.fixture
-    def users_api_spec_path(self):
-        """Path to Users API OpenAPI spec"""
-        return Path("contracts/openapi-specs/users-api-v1.yaml")
-    
     
     def test_openapi_spec_exists(self, users_api_spec_path):
         """
@@ -34,28 +84,24 @@ class TestOpenAPISpecValidation:
         
         print(f"\nOpenAPI Spec: File exists at {users_api_spec_path}")
         
-    def test_openapi_spec_is_valid_yaml(self, users_api_spec_path):
+    def test_openapi_spec_is_valid_yaml(self, parsed_spec):
         """
         Test: OpenAPI spec is valid YAML
         
         Validates YAML syntax before validating OpenAPI structure
         """
-        try:
-            with open(users_api_spec_path, 'r') as f:
-                spec = yaml.safe_load(f)
-            
-            assert spec is not None, "YAML file is empty"
-            assert isinstance(spec, dict), "YAML root must be an object"
-            
-            print(f"\nYAML Syntax: Valid")
-            print(f" Title: {spec.get('info', {}).get('title', 'N/A')}")
-            print(f" Version: {spec.get('info', {}).get('version', 'N/A')}")
+        spec = parsed_spec
         
-        except yaml.YAMLError as e:
-            pytest.fail(f"Invalid YAML syntax: {e}")
+        assert spec is not None, "YAML file is empty"
+        assert isinstance(spec, dict), "YAML root must be an object"
+        
+        print(f"\nYAML Syntax: Valid")
+        print(f" Title: {spec.get('info', {}).get('title', 'N/A')}")
+        print(f" Version: {spec.get('info', {}).get('version', 'N/A')}")
 
 
-    def test_openapi_spec_is_valid_openapi(self, users_api_spec_path):
+    def test_openapi_spec_is_valid_openapi(self, parsed_spec, spec_validator_cls,
+                                           component_schemas):
         """
         Test: OpenAPI spec follows OpenAPI 3.0 standard
         
@@ -66,17 +112,17 @@ class TestOpenAPISpecValidation:
         - Response structures
         """
         try:
-            # Read and validate spec
-            spec_dict, spec_url = read_from_filename(str(users_api_spec_path))
-            validate(spec_dict)
+            # Validate the already-parsed spec with the pre-selected validator
+            spec_dict = parsed_spec
+            validate(spec_dict, cls=spec_validator_cls)
             
             print(f"\nOpenAPI Validation: Spec is valid OpenAPI 3.0")
             print(f"Paths defined: {len(spec_dict.get('paths', {}))}")
-            print(f"Schemas defined: {len(spec_dict.get('components', {}).get('schemas', {}))}")
+            print(f"Schemas defined: {len(component_schemas)}")
             
         except Exception as e:
             pytest.fail(f"OpenAPI validation failed: {e}")
-    def test_required_openapi_fields_present(self, users_api_spec_path):
+    def test_required_openapi_fields_present(self, parsed_spec):
         """
         Test: All required OpenAPI fields are present
         
@@ -85,8 +131,7 @@ class TestOpenAPISpecValidation:
         - info (title, version)
         - paths
         """
-        with open(users_api_spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
+        spec = parsed_spec
         
         # Check openapi version
         assert 'openapi' in spec, "Missing 'openapi' field"
@@ -105,27 +150,15 @@ class TestOpenAPISpecValidation:
         print(f"\nRequired Fields: All present")
     
     
-    def test_all_paths_have_operations(self, users_api_spec_path):
+    def test_all_paths_have_operations(self, parsed_spec, spec_defects):
         """
         Test: All paths have at least one operation
         
         Each path should define at least one HTTP method (GET, POST, etc.)
         """
-        with open(users_api_spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
-        
-        paths = spec.get('paths', {})
+        paths = parsed_spec.get('paths', {})
         
-        invalid_paths = []
-        
-        for path, operations in paths.items():
-            # Valid HTTP methods in OpenAPI
-            http_methods = ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']
-            
-            has_operation = any(method in operations for method in http_methods)
-            
-            if not has_operation:
-                invalid_paths.append(path)
+        invalid_paths = spec_defects['paths_without_operations']
         
         if invalid_paths:
             pytest.fail(
@@ -135,69 +168,34 @@ class TestOpenAPISpecValidation:
         print(f"\nPath Operations: All {len(paths)} paths have operations")
     
     
-    def test_all_operations_have_responses(self, users_api_spec_path):
+    def test_all_operations_have_responses(self, spec_defects):
         """
         Test: All operations define responses
         
         Every operation must define at least one response
         """
-        with open(users_api_spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
-        
-        paths = spec.get('paths', {})
-        
-        missing_responses = []
-        
-        for path, operations in paths.items():
-            http_methods = ['get', 'post', 'put', 'delete', 'patch']
-            
-            for method in http_methods:
-                if method in operations:
-                    operation = operations[method]
-                    
-                    if 'responses' not in operation:
-                        missing_responses.append(f"{method.upper()} {path}")
-                    elif len(operation['responses']) == 0:
-                        missing_responses.append(f"{method.upper()} {path} (empty)")
+        missing_responses = spec_defects['operations_without_responses']
         
         if missing_responses:
-            pytest.fail(
-                f"Operations without responses:\n" +
-                "\n".join(f"  - {op}" for op in missing_responses)
-            )
+            pytest.fail("\n  - ".join(["Operations without responses:", *missing_responses]))
         
         print(f"\nResponses: All operations define responses")
     
     
-    def test_schemas_are_well_defined(self, users_api_spec_path):
+    def test_schemas_are_well_defined(self, component_schemas, spec_defects, verbose):
         """
         Test: All schemas have required properties defined
         
         Validates component schemas are properly structured
         """
-        with open(users_api_spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
-        
-        schemas = spec.get('components', {}).get('schemas', {})
+        schemas = component_schemas
         
-        issues = []
-        
-        for schema_name, schema_def in schemas.items():
-            # Check type is defined
-            if 'type' not in schema_def and '$ref' not in schema_def:
-                issues.append(f"{schema_name}: Missing 'type' field")
-            
-            # If object type, check properties
-            if schema_def.get('type') == 'object':
-                if 'properties' not in schema_def:
-                    issues.append(f"{schema_name}: Object without 'properties'")
+        issues = spec_defects['schema_issues']
         
         if issues:
-            pytest.fail(
-                f"Schema definition issues:\n" +
-                "\n".join(f"  - {issue}" for issue in issues)
-            )
+            pytest.fail("\n  - ".join(["Schema definition issues:", *issues]))
         
         print(f"\nSchemas: All {len(schemas)} schemas well-defined")
-        for schema_name in schemas.keys():
-            print(f"   - {schema_name}")
\ No newline at end of file
+        if verbose:
+            for schema_name in schemas.keys():
+                print(f"   - {schema_name}")
\ No newline at end of file
@@ -9,6 +9,7 @@ from utils.api_helper import APIHelper
 from utils.api_logger import logger
 
 
+@pytest.mark.xdist_group("http")
 class TestPerformanceTracking:
     """Performance tracking and comparison tests"""
     
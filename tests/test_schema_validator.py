@@ -0,0 +1,259 @@
+"""
+Schema Validator Tests
+Tests SchemaValidator against plain Draft7Validator output
+
+Runs offline with inline User payloads
+"""
+import re
+import pytest
+from jsonschema import Draft7Validator
+from utils.schema_validator import (
+    SchemaValidator, _compile_check, _format_match, _EMAIL_PATTERN, _URI_PATTERN
+)
+
+USER_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'name', 'email', 'username'],
+    'properties': {
+        'id': {'type': 'integer'},
+        'name': {'type': 'string', 'minLength': 1},
+        'email': {'type': 'string', 'format': 'email'},
+        'username': {'type': 'string', 'minLength': 3},
+        'address': {
+            'type': 'object',
+            'properties': {
+                'street': {'type': 'string'},
+                'geo': {
+                    'type': 'object',
+                    'properties': {
+                        'lat': {'type': 'string'},
+                        'lng': {'type': 'string'}
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Numeric/boolean enum and const values, where Python's True == 1 matters
+FLAGGED_USER_SCHEMA = dict(USER_SCHEMA, properties=dict(USER_SCHEMA['properties'], flags={
+    'type': 'object',
+    'properties': {
+        'active': {'enum': [0, 1]},
+        'version': {'const': 0},
+        'verified': {'enum': [True]}
+    }
+}))
+
+# Schemas each payload is checked against: plain (fastjsonschema check)
+# and flagged (Draft7Validator only)
+USER_SCHEMAS = {'plain': USER_SCHEMA, 'flagged': FLAGGED_USER_SCHEMA}
+
+VALID_USER = {
+    'id': 1,
+    'name': 'Leanne Graham',
+    'email': 'Sincere@april.biz',
+    'username': 'Bret',
+    'address': {'street': 'Kulas Light', 'geo': {'lat': '-37.3159', 'lng': '81.1496'}}
+}
+
+USER_PAYLOADS = {
+    'valid': VALID_USER,
+    'wrong_types': dict(VALID_USER, id='1', name=42),
+    'missing_required': {'id': 1, 'name': 'Leanne Graham'},
+    'nested_errors': dict(VALID_USER, address={'street': 7, 'geo': {'lat': -37.3159}}),
+    'not_an_object': ['Bret'],
+    'bool_for_enum': dict(VALID_USER, flags={'active': False}),
+    'bool_for_const': dict(VALID_USER, flags={'version': False}),
+    'number_for_bool_enum': dict(VALID_USER, flags={'verified': 1})
+}
+
+# (data, schema) pairs fastjsonschema alone would accept but Draft7 rejects
+ENUM_CONST_CASES = [
+    (True, {'enum': [1]}),
+    (False, {'const': 0}),
+    ({'a': False}, {'properties': {'a': {'enum': [0, 1]}}}),
+]
+
+
+# (format, value, valid) with the same result under re and RE2
+FORMAT_CASES = [
+    ('email', 'Sincere@april.biz', True),
+    ('email', 'a@b.com\n', False),
+    ('email', 'a @b.com', False),
+    ('uri', 'https://example.com', True),
+    ('uri', 'HTTP://LOCALHOST:8080/a?b', True),
+    ('uri', 'http://1.2.3.4', True),
+    ('uri', 'hildegard.org', False),
+    ('uri', 'http://example.com\n', False),
+    ('uri', 'http://\u0661.\u0662.\u0663.\u0664', False),  # Arabic-Indic digits
+    ('uri', 'http://example.com/a\u00a0b', False),  # no-break space
+    ('uri', 'http://example.com/a\x0bb', False),  # vertical tab
+]
+
+FORMAT_PATTERNS = {'email': _EMAIL_PATTERN, 'uri': _URI_PATTERN}
+
+
+def draft7_errors(data, schema, full_spec=None):
+    """Errors reported by a plain Draft7Validator, in SchemaValidator's format"""
+    if full_spec is None:
+        validator = Draft7Validator(schema)
+    else:
+        from jsonschema import RefResolver
+        validator = Draft7Validator(schema, resolver=RefResolver.from_schema(full_spec))
+
+    return [
+        f"{' -> '.join(map(str, error.path)) if error.path else 'root'}: {error.message}"
+        for error in validator.iter_errors(data)
+    ]
+
+
+class TestSchemaValidator:
+    """SchemaValidator tests (fastjsonschema check with Draft7 error reporting)"""
+
+    @pytest.fixture
+    def validator(self):
+        """Create SchemaValidator instance"""
+        return SchemaValidator()
+
+    @pytest.mark.parametrize('schema_name', list(USER_SCHEMAS))
+    @pytest.mark.parametrize('case', list(USER_PAYLOADS))
+    def test_errors_match_draft7(self, validator, case, schema_name):
+        """Test: compiled validation reports the same errors as Draft7Validator"""
+        schema = USER_SCHEMAS[schema_name]
+        data = USER_PAYLOADS[case]
+
+        errors = validator.compile(schema)(data)
+
+        assert errors == draft7_errors(data, schema)
+        assert case != 'valid' or errors == [], f"Valid payload rejected: {errors}"
+        print(f"Test passed: '{case}' payload, {schema_name} schema ({len(errors)} errors)")
+
+    @pytest.mark.parametrize('schema_name', list(USER_SCHEMAS))
+    @pytest.mark.parametrize('case', list(USER_PAYLOADS))
+    def test_array_wrapper_matches_draft7(self, validator, case, schema_name):
+        """Test: array-of-users schema reports item errors like Draft7Validator"""
+        schema = {'type': 'array', 'items': USER_SCHEMAS[schema_name]}
+        data = [VALID_USER, USER_PAYLOADS[case]]
+
+        errors = validator.compile(schema)(data)
+
+        assert errors == draft7_errors(data, schema)
+        assert case != 'valid' or errors == []
+        print(f"Test passed: '{case}' payload in array, {schema_name} schema ({len(errors)} errors)")
+
+    @pytest.mark.parametrize('data, schema', ENUM_CONST_CASES)
+    def test_numeric_enum_const_match_draft7(self, validator, data, schema):
+        """Test: booleans are not accepted for numeric enum/const values (True != 1)"""
+        errors = validator.compile(schema)(data)
+
+        assert errors and errors == draft7_errors(data, schema)
+
+    @pytest.mark.parametrize('case', ['valid', 'wrong_types', 'missing_required'])
+    def test_ref_schema_with_full_spec(self, validator, openapi_loader, case):
+        """Test: $ref schema resolved against full spec matches Draft7Validator"""
+        full_spec = openapi_loader.get_spec()
+        schema = {'$ref': '#/components/schemas/User'}
+        data = USER_PAYLOADS[case]
+
+        errors = validator.validate(data, schema, full_spec=full_spec)
+
+        assert errors == draft7_errors(data, schema, full_spec)
+        assert bool(errors) == (case != 'valid')
+        print(f"Test passed: '{case}' payload against $ref schema")
+
+    @pytest.mark.parametrize('case', ['valid', 'wrong_types', 'missing_required'])
+    def test_ref_outside_components(self, validator, openapi_loader, case):
+        """Test: $ref into paths (not components) resolves like Draft7Validator"""
+        full_spec = openapi_loader.get_spec()
+        schema = {'$ref': '#/paths/~1users~1{id}/get/responses/200/content/application~1json/schema'}
+        data = USER_PAYLOADS[case]
+
+        errors = validator.compile(schema, full_spec=full_spec)(data)
+
+        assert errors == draft7_errors(data, schema, full_spec)
+        assert bool(errors) == (case != 'valid')
+        print(f"Test passed: '{case}' payload against $ref into paths")
+
+    def test_compiled_check_is_reusable(self, validator):
+        """Test: one compiled check validates many payloads"""
+        check = validator.compile(USER_SCHEMA)
+
+        for case, data in USER_PAYLOADS.items():
+            assert check(data) == draft7_errors(data, USER_SCHEMA), f"Mismatch for '{case}'"
+
+        print(f"Test passed: {len(USER_PAYLOADS)} payloads through one compiled check")
+
+    @pytest.mark.parametrize('case', list(USER_PAYLOADS))
+    def test_validate_matches_draft7(self, validator, case):
+        """Test: one-off validate() reports the same errors as Draft7Validator"""
+        data = USER_PAYLOADS[case]
+
+        assert validator.validate(data, FLAGGED_USER_SCHEMA) == draft7_errors(data, FLAGGED_USER_SCHEMA)
+
+    def test_validate_does_not_compile(self, validator):
+        """Test: one-off validate() generates no code"""
+        misses = _compile_check.cache_info().misses
+
+        for _ in range(3):
+            schema = dict(USER_SCHEMA)  # fresh object, as resolve_refs() returns
+            assert validator.validate(VALID_USER, schema) == []
+
+        assert _compile_check.cache_info().misses == misses
+
+    def test_schema_edited_in_place(self, validator):
+        """Test: editing a schema is seen by validate() and by a new compile()"""
+        schema = {'type': 'object', 'required': ['a']}
+        data = {'a': 1}
+
+        check = validator.compile(schema)
+        assert validator.validate(data, schema) == []
+
+        schema['required'] = ['b']
+
+        expected = draft7_errors(data, schema)
+        assert expected == ["root: 'b' is a required property"]
+        assert validator.validate(data, schema) == expected
+        assert validator.compile(schema)(data) == expected
+        # Handles from compile() are frozen at compile time
+        assert check(data) == []
+
+    def test_compiled_cache_is_bounded(self, validator):
+        """Test: schemas compiled per call do not accumulate in the compiled cache"""
+        assert _compile_check.cache_info().maxsize is not None
+
+        check = validator.compile(USER_SCHEMA)
+        size = _compile_check.cache_info().currsize
+
+        for _ in range(10):
+            schema = dict(USER_SCHEMA)  # fresh object with equal content
+            assert validator.compile(schema) is check
+
+        assert _compile_check.cache_info().currsize == size
+        print(f"Test passed: compiled cache held at {size} entries")
+
+    def test_resolver_cache_is_bounded(self, validator, openapi_loader):
+        """Test: full specs built per call do not accumulate in the resolver cache"""
+        schema = {'$ref': '#/components/schemas/User'}
+        invalid_user = USER_PAYLOADS['wrong_types']
+
+        for _ in range(SchemaValidator._RESOLVER_CACHE_SIZE + 2):
+            full_spec = dict(openapi_loader.get_spec())
+            assert validator.validate(invalid_user, schema, full_spec=full_spec)
+
+        assert len(SchemaValidator._resolvers) <= SchemaValidator._RESOLVER_CACHE_SIZE
+        print(f"Test passed: resolver cache held at {len(SchemaValidator._resolvers)} entries")
+
+    @pytest.mark.parametrize('format_type, value, expected', FORMAT_CASES)
+    def test_format_validation(self, validator, format_type, value, expected):
+        """Test: email/uri format checks accept and reject the expected values"""
+        assert validator.validate_format(value, format_type) is expected
+
+    @pytest.mark.parametrize('format_type, value, expected', FORMAT_CASES)
+    def test_format_patterns_engine_neutral(self, format_type, value, expected):
+        """Test: format patterns give the same result under re and RE2"""
+        re2 = pytest.importorskip('re2')
+        pattern = FORMAT_PATTERNS[format_type]
+
+        assert _format_match(re.compile(pattern), value) is expected
+        assert _format_match(re2.compile(pattern), value) is expected
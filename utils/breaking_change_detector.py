@@ -9,9 +9,36 @@ Breaking changes are changes that break existing API consumers:
 - Changing response codes
 - Removing enum values
 """
-from typing import Dict, Any, List, Tuple
+import multiprocessing
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, Final, Iterator, List, Optional, Tuple
 from utils.openapi_loader import OpenAPILoader
 
+try:
+    from deepdiff import DeepDiff
+except ImportError:  # optional: the hand-rolled detectors are used instead
+    DeepDiff = None
+
+# Severity and category labels, interned so comparisons and Counter
+# lookups across many BreakingChange instances hit the identity fast path
+SEVERITY_CRITICAL: Final = sys.intern('critical')
+SEVERITY_HIGH: Final = sys.intern('high')
+SEVERITY_MEDIUM: Final = sys.intern('medium')
+
+CATEGORY_SCHEMA_REMOVED: Final = sys.intern('schema_removed')
+CATEGORY_FIELD_REMOVED: Final = sys.intern('field_removed')
+CATEGORY_TYPE_CHANGED: Final = sys.intern('type_changed')
+CATEGORY_REQUIRED_FIELD_ADDED: Final = sys.intern('required_field_added')
+CATEGORY_REQUIRED_FIELD_REMOVED: Final = sys.intern('required_field_removed')
+CATEGORY_ENDPOINT_REMOVED: Final = sys.intern('endpoint_removed')
+CATEGORY_RESPONSE_CODE_CHANGED: Final = sys.intern('response_code_changed')
+
+# HTTP methods compared between spec versions, in report order
+_HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
 
 class BreakingChange:
     """
@@ -27,17 +54,28 @@ class BreakingChange:
         impact: Business impact description
     """
     
+    # No per-instance __dict__: large diffs create many of these
+    __slots__ = ('category', 'severity', 'path', 'old_value', 'new_value',
+                 'description', 'impact')
+    
     def __init__(self, category: str, severity: str, path: str,
                  old_value: Any, new_value: Any, description: str,
                  impact: str = ""):
-        self.category = category
-        self.severity = severity
+        # Interned so labels from any source share the module constants
+        self.category = sys.intern(category)
+        self.severity = sys.intern(severity)
         self.path = path
         self.old_value = old_value
         self.new_value = new_value
         self.description = description
         self.impact = impact
     
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled (batch worker) labels are re-interned
+        return (BreakingChange, (self.category, self.severity, self.path,
+                                 self.old_value, self.new_value,
+                                 self.description, self.impact))
+    
     def __repr__(self):
         return (f"BreakingChange({self.severity.upper()}: {self.category} "
                 f"at {self.path})")
@@ -66,158 +104,179 @@ class BreakingChangeDetector:
             print(f"Found {len(changes)} breaking changes!")
     """
     
-    def __init__(self, old_spec_path: str, new_spec_path: str):
+    def __init__(self, old_spec_path: str, new_spec_path: str,
+                 use_deepdiff: bool = False):
         """
         Initialize detector with two spec versions.
         
         Args:
             old_spec_path: Path to old/current OpenAPI spec
             new_spec_path: Path to new/proposed OpenAPI spec
+            use_deepdiff: Diff schemas with DeepDiff, which also reaches
+                nested (items/allOf/...) schemas. Falls back to the built-in
+                detectors when deepdiff is not installed
         """
         self.old_loader = OpenAPILoader(old_spec_path)
         self.new_loader = OpenAPILoader(new_spec_path)
         
-        self.old_spec = self.old_loader.get_spec()
-        self.new_spec = self.new_loader.get_spec()
+        # Load both specs concurrently to overlap file reads
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            old_future = executor.submit(self.old_loader.get_spec)
+            new_future = executor.submit(self.new_loader.get_spec)
+            self.old_spec, self.new_spec = old_future.result(), new_future.result()
+        
+        self.use_deepdiff = use_deepdiff and DeepDiff is not None
+        self._changes = None
     
     
-    def detect_all_changes(self) -> List[BreakingChange]:
+    @cached_property
+    def old_paths(self) -> Dict[str, Any]:
+        """paths of the old spec"""
+        return self.old_spec.get('paths', {})
+    
+    
+    @cached_property
+    def new_paths(self) -> Dict[str, Any]:
+        """paths of the new spec"""
+        return self.new_spec.get('paths', {})
+    
+    
+    @cached_property
+    def old_schemas(self) -> Dict[str, Any]:
+        """components/schemas of the old spec"""
+        return self.old_spec.get('components', {}).get('schemas', {})
+    
+    
+    @cached_property
+    def new_schemas(self) -> Dict[str, Any]:
+        """components/schemas of the new spec"""
+        return self.new_spec.get('components', {}).get('schemas', {})
+    
+    
+    @cached_property
+    def common_schemas(self) -> Tuple[str, ...]:
+        """Schema names present in both specs, in old spec order"""
+        new_names = self.new_schemas.keys()
+        return tuple(name for name in self.old_schemas if name in new_names)
+    
+    
+    @classmethod
+    def detect_all_changes_batch(cls, pairs: List[Tuple[str, str]],
+                                 workers: Optional[int] = None,
+                                 chunksize: int = 1) -> Dict[Tuple[str, str], List[BreakingChange]]:
         """
-        Detect all breaking changes between specs.
+        Detect breaking changes for many spec pairs in parallel processes.
         
+        Each pair is compared by its own detector in a worker process.
+        Processes are started with 'forkserver' where available (avoids
+        forking a parent holding libyaml state), otherwise 'spawn'.
+        
+        Args:
+            pairs: List of (old_spec_path, new_spec_path) tuples
+            workers: Number of worker processes (default: CPU count)
+            chunksize: Pairs sent to a worker per task. Keep 1 for a few
+                large specs; raise it for many small specs to cut IPC overhead
+            
         Returns:
-            List of BreakingChange objects
+            Dict mapping each (old, new) pair to its list of BreakingChange objects
         """
-        changes = []
-        
-        # Detect schema changes
-        changes.extend(self.detect_schema_changes())
-        
-        # Detect response changes
-        changes.extend(self.detect_response_changes())
+        if not pairs:
+            return {}
         
-        # Detect required field changes
-        changes.extend(self.detect_required_field_changes())
+        start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                        else 'spawn')
+        context = multiprocessing.get_context(start_method)
         
-        # Detect type changes
-        changes.extend(self.detect_type_changes())
+        with context.Pool(processes=workers) as pool:
+            results = pool.starmap(_run_pair, pairs, chunksize=chunksize)
         
-        return changes
+        return dict(results)
     
     
-    def detect_schema_changes(self) -> List[BreakingChange]:
-        """
-        Detect changes in component schemas.
-        
-        Breaking changes:
-        - Field removed
-        - Schema removed
+    def detect_all_changes(self) -> List[BreakingChange]:
         """
-        changes = []
-        
-        old_schemas = self.old_spec.get('components', {}).get('schemas', {})
-        new_schemas = self.new_spec.get('components', {}).get('schemas', {})
+        Detect all breaking changes between specs.
         
-        # Check for removed schemas
-        for schema_name in old_schemas.keys():
-            if schema_name not in new_schemas:
-                changes.append(BreakingChange(
-                    category='schema_removed',
-                    severity='critical',
-                    path=f'schemas/{schema_name}',
-                    old_value=schema_name,
-                    new_value=None,
-                    description=f"Schema '{schema_name}' was removed",
-                    impact=f"All consumers using {schema_name} will break"
-                ))
+        The diff runs once per detector; later calls return a copy
+        of the cached result.
         
-        # Check for removed fields in schemas
-        for schema_name in old_schemas.keys():
-            if schema_name in new_schemas:
-                old_properties = old_schemas[schema_name].get('properties', {})
-                new_properties = new_schemas[schema_name].get('properties', {})
-                
-                for field_name in old_properties.keys():
-                    if field_name not in new_properties:
-                        changes.append(BreakingChange(
-                            category='field_removed',
-                            severity='critical',
-                            path=f'schemas/{schema_name}.{field_name}',
-                            old_value=old_properties[field_name],
-                            new_value=None,
-                            description=f"Field '{field_name}' removed from {schema_name}",
-                            impact=f"Consumers expecting '{field_name}' will fail"
-                        ))
+        Returns:
+            List of BreakingChange objects
+        """
+        if self._changes is None:
+            if self.use_deepdiff:
+                self._changes = self._detect_all_changes_deepdiff()
+            else:
+                self._changes = self._detect_all_changes()
         
-        return changes
+        return list(self._changes)
     
     
-    def detect_type_changes(self) -> List[BreakingChange]:
+    def _detect_all_changes(self) -> List[BreakingChange]:
         """
-        Detect field type changes.
+        Run every detector and collect their changes.
         
-        Breaking change:
-        - Field type changed (e.g., integer → string)
+        Schema, field, type and required-field checks share one walk over
+        the component schemas; results are grouped in the same order as
+        the per-category detectors.
         """
-        changes = []
+        schema_changes = []
+        required_changes = []
+        type_changes = []
         
-        old_schemas = self.old_spec.get('components', {}).get('schemas', {})
-        new_schemas = self.new_spec.get('components', {}).get('schemas', {})
+        # Removed schemas
+        for schema_name in self._walk_removed_schemas():
+            schema_changes.append(BreakingChange(
+                category=CATEGORY_SCHEMA_REMOVED,
+                severity=SEVERITY_CRITICAL,
+                path=f'schemas/{schema_name}',
+                old_value=schema_name,
+                new_value=None,
+                description=f"Schema '{schema_name}' was removed",
+                impact=f"All consumers using {schema_name} will break"
+            ))
         
-        for schema_name in old_schemas.keys():
-            if schema_name not in new_schemas:
-                continue
+        # Field, type and required-field changes in schemas present in both specs
+        for schema_name, old_schema, new_schema in self._walk_schemas():
+            old_properties = old_schema.get('properties', {})
+            new_properties = new_schema.get('properties', {})
             
-            old_properties = old_schemas[schema_name].get('properties', {})
-            new_properties = new_schemas[schema_name].get('properties', {})
-            
-            for field_name in old_properties.keys():
+            for field_name, old_field in old_properties.items():
                 if field_name not in new_properties:
+                    schema_changes.append(BreakingChange(
+                        category=CATEGORY_FIELD_REMOVED,
+                        severity=SEVERITY_CRITICAL,
+                        path=f'schemas/{schema_name}.{field_name}',
+                        old_value=old_field,
+                        new_value=None,
+                        description=f"Field '{field_name}' removed from {schema_name}",
+                        impact=f"Consumers expecting '{field_name}' will fail"
+                    ))
                     continue
                 
-                old_type = old_properties[field_name].get('type')
+                old_type = old_field.get('type')
                 new_type = new_properties[field_name].get('type')
                 
                 if old_type and new_type and old_type != new_type:
-                    changes.append(BreakingChange(
-                        category='type_changed',
-                        severity='critical',
+                    type_changes.append(BreakingChange(
+                        category=CATEGORY_TYPE_CHANGED,
+                        severity=SEVERITY_CRITICAL,
                         path=f'schemas/{schema_name}.{field_name}',
                         old_value=old_type,
                         new_value=new_type,
                         description=f"Field '{field_name}' type changed from {old_type} to {new_type}",
                         impact=f"Type mismatch will cause parsing errors"
                     ))
-        
-        return changes
-    
-    
-    def detect_required_field_changes(self) -> List[BreakingChange]:
-        """
-        Detect changes in required fields.
-        
-        Breaking change:
-        - New required field added
-        - Required field removed (less common, but notable)
-        """
-        changes = []
-        
-        old_schemas = self.old_spec.get('components', {}).get('schemas', {})
-        new_schemas = self.new_spec.get('components', {}).get('schemas', {})
-        
-        for schema_name in old_schemas.keys():
-            if schema_name not in new_schemas:
-                continue
             
-            old_required = set(old_schemas[schema_name].get('required', []))
-            new_required = set(new_schemas[schema_name].get('required', []))
+            old_required = set(old_schema.get('required', []))
+            new_required = set(new_schema.get('required', []))
             
             # New required fields (breaking)
             added_required = new_required - old_required
             for field in added_required:
-                changes.append(BreakingChange(
-                    category='required_field_added',
-                    severity='high',
+                required_changes.append(BreakingChange(
+                    category=CATEGORY_REQUIRED_FIELD_ADDED,
+                    severity=SEVERITY_HIGH,
                     path=f'schemas/{schema_name}.required',
                     old_value=list(old_required),
                     new_value=list(new_required),
@@ -228,9 +287,9 @@ class BreakingChangeDetector:
             # Removed required fields (less breaking, but notable)
             removed_required = old_required - new_required
             for field in removed_required:
-                changes.append(BreakingChange(
-                    category='required_field_removed',
-                    severity='medium',
+                required_changes.append(BreakingChange(
+                    category=CATEGORY_REQUIRED_FIELD_REMOVED,
+                    severity=SEVERITY_MEDIUM,
                     path=f'schemas/{schema_name}.required',
                     old_value=list(old_required),
                     new_value=list(new_required),
@@ -238,7 +297,169 @@ class BreakingChangeDetector:
                     impact=f"Field is now optional (usually safe change)"
                 ))
         
-        return changes
+        return (schema_changes + self.detect_response_changes()
+                + required_changes + type_changes)
+    
+    
+    def _detect_all_changes_deepdiff(self) -> List[BreakingChange]:
+        """
+        Run every detector, diffing component schemas with DeepDiff.
+        
+        DeepDiff reports are translated onto the same categories (and the
+        same grouping order) as _detect_all_changes. Removed or added
+        'properties' and 'required' containers are expanded into one change
+        per field, and a replaced required entry counts as one removal and
+        one addition; type changes are also reported for nested schemas.
+        """
+        schema_changes = []
+        required_changes = []
+        type_changes = []
+        
+        # threshold_to_diff_deeper=0: always report per-key changes, never
+        # collapse a dict with few common keys (e.g. renamed properties)
+        # into one values_changed
+        diff = DeepDiff(self.old_schemas, self.new_schemas, ignore_order=True,
+                        cache_size=5000, cache_tuning_sample_size=500,
+                        get_deep_distance=False, threshold_to_diff_deeper=0,
+                        view='tree')
+        
+        for level in diff.get('dictionary_item_removed', ()):
+            keys = level.path(output_format='list')
+            
+            if len(keys) == 1:
+                schema_name = keys[0]
+                schema_changes.append(BreakingChange(
+                    category=CATEGORY_SCHEMA_REMOVED,
+                    severity=SEVERITY_CRITICAL,
+                    path=f'schemas/{schema_name}',
+                    old_value=schema_name,
+                    new_value=None,
+                    description=f"Schema '{schema_name}' was removed",
+                    impact=f"All consumers using {schema_name} will break"
+                ))
+            elif keys[-2] == 'properties':
+                schema_changes.append(_field_removed(keys, level.t1))
+            elif keys[-1] == 'properties':
+                # Whole properties block removed
+                schema_changes.extend(_field_removed(keys + [field_name], old_field)
+                                      for field_name, old_field in level.t1.items())
+            elif keys[-1] == 'required':
+                # Whole required list removed
+                old_required = list(level.t1)
+                required_changes.extend(_required_changed(keys, field, old_required, [])
+                                        for field in dict.fromkeys(old_required))
+        
+        for level in diff.get('dictionary_item_added', ()):
+            keys = level.path(output_format='list')
+            
+            if len(keys) > 1 and keys[-1] == 'required' and keys[-2] != 'properties':
+                # Required list added to a schema that had none
+                new_required = list(level.t2)
+                required_changes.extend(_required_changed(keys, field, [], new_required)
+                                        for field in dict.fromkeys(new_required))
+        
+        # Entries added to, removed from or replaced in a required list
+        for report in ('iterable_item_removed', 'iterable_item_added', 'values_changed'):
+            for level in diff.get(report, ()):
+                keys = level.path(output_format='list')
+                
+                if len(keys) < 2 or keys[-2] != 'required' or not isinstance(keys[-1], int):
+                    continue
+                
+                old_required, new_required = list(level.up.t1), list(level.up.t2)
+                
+                if report != 'iterable_item_added':
+                    required_changes.append(_required_changed(
+                        keys[:-1], level.t1, old_required, new_required
+                    ))
+                if report != 'iterable_item_removed':
+                    required_changes.append(_required_changed(
+                        keys[:-1], level.t2, old_required, new_required
+                    ))
+        
+        for level in (*diff.get('values_changed', ()), *diff.get('type_changes', ())):
+            keys = level.path(output_format='list')
+            
+            # 'type' keyword only (not a field or schema named 'type')
+            if keys[-1] != 'type' or len(keys) < 2 or keys[-2] == 'properties':
+                continue
+            
+            owner_keys = keys[:-1]
+            if len(owner_keys) == 1:
+                owner = f"Schema '{owner_keys[0]}'"
+            elif owner_keys[-2] == 'properties':
+                owner = f"Field '{owner_keys[-1]}'"
+            else:
+                owner = f"'{_schema_location(owner_keys)}'"
+            
+            old_type, new_type = level.t1, level.t2
+            type_changes.append(BreakingChange(
+                category=CATEGORY_TYPE_CHANGED,
+                severity=SEVERITY_CRITICAL,
+                path=_schema_path(owner_keys),
+                old_value=old_type,
+                new_value=new_type,
+                description=f"{owner} type changed from {old_type} to {new_type}",
+                impact=f"Type mismatch will cause parsing errors"
+            ))
+        
+        return (schema_changes + self.detect_response_changes()
+                + required_changes + type_changes)
+    
+    
+    def _walk_schemas(self) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """Yield (name, old_schema, new_schema) for schemas in both specs"""
+        old_schemas = self.old_schemas
+        new_schemas = self.new_schemas
+        
+        for schema_name in self.common_schemas:
+            yield schema_name, old_schemas[schema_name], new_schemas[schema_name]
+    
+    
+    def _walk_removed_schemas(self) -> Iterator[str]:
+        """Yield names of schemas removed in the new spec, in old spec order"""
+        removed_schemas = self.old_schemas.keys() - self.new_schemas.keys()
+        
+        for schema_name in self.old_schemas:
+            if schema_name in removed_schemas:
+                yield schema_name
+    
+    
+    def _changes_in(self, *categories: str) -> List[BreakingChange]:
+        """Filter the detected changes by category"""
+        return [c for c in self.detect_all_changes() if c.category in categories]
+    
+    
+    def detect_schema_changes(self) -> List[BreakingChange]:
+        """
+        Detect changes in component schemas.
+        
+        Breaking changes:
+        - Field removed
+        - Schema removed
+        """
+        return self._changes_in(CATEGORY_SCHEMA_REMOVED, CATEGORY_FIELD_REMOVED)
+    
+    
+    def detect_type_changes(self) -> List[BreakingChange]:
+        """
+        Detect field type changes.
+        
+        Breaking change:
+        - Field type changed (e.g., integer → string)
+        """
+        return self._changes_in(CATEGORY_TYPE_CHANGED)
+    
+    
+    def detect_required_field_changes(self) -> List[BreakingChange]:
+        """
+        Detect changes in required fields.
+        
+        Breaking change:
+        - New required field added
+        - Required field removed (less common, but notable)
+        """
+        return self._changes_in(CATEGORY_REQUIRED_FIELD_ADDED, CATEGORY_REQUIRED_FIELD_REMOVED)
     
     
     def detect_response_changes(self) -> List[BreakingChange]:
@@ -251,22 +472,22 @@ class BreakingChangeDetector:
         """
         changes = []
         
-        old_paths = self.old_spec.get('paths', {})
-        new_paths = self.new_spec.get('paths', {})
+        old_paths = self.old_paths
+        new_paths = self.new_paths
         
         for path, path_item in old_paths.items():
             if path not in new_paths:
                 continue
             
-            # Check each HTTP method
-            for method in ['get', 'post', 'put', 'delete', 'patch']:
+            # Check each HTTP method the old path defines
+            for method in _HTTP_METHODS:
                 if method not in path_item:
                     continue
                 
                 if method not in new_paths[path]:
                     changes.append(BreakingChange(
-                        category='endpoint_removed',
-                        severity='critical',
+                        category=CATEGORY_ENDPOINT_REMOVED,
+                        severity=SEVERITY_CRITICAL,
                         path=f'{method.upper()} {path}',
                         old_value=method,
                         new_value=None,
@@ -278,22 +499,22 @@ class BreakingChangeDetector:
                 old_responses = path_item[method].get('responses', {})
                 new_responses = new_paths[path][method].get('responses', {})
                 
-                # Check for changed success response codes
-                old_success_codes = [code for code in old_responses.keys() 
-                                    if code.startswith('2')]
-                new_success_codes = [code for code in new_responses.keys() 
-                                    if code.startswith('2')]
+                # Check for changed success response codes (first 2xx only)
+                old_success_code = next((code for code in old_responses 
+                                         if code.startswith('2')), None)
+                new_success_code = next((code for code in new_responses 
+                                         if code.startswith('2')), None)
                 
-                if old_success_codes and new_success_codes:
-                    if old_success_codes[0] != new_success_codes[0]:
+                if old_success_code and new_success_code:
+                    if old_success_code != new_success_code:
                         changes.append(BreakingChange(
-                            category='response_code_changed',
-                            severity='high',
+                            category=CATEGORY_RESPONSE_CODE_CHANGED,
+                            severity=SEVERITY_HIGH,
                             path=f'{method.upper()} {path}',
-                            old_value=old_success_codes[0],
-                            new_value=new_success_codes[0],
-                            description=f"Success response code changed from {old_success_codes[0]} to {new_success_codes[0]}",
-                            impact=f"Consumers checking for {old_success_codes[0]} will miss successful responses"
+                            old_value=old_success_code,
+                            new_value=new_success_code,
+                            description=f"Success response code changed from {old_success_code} to {new_success_code}",
+                            impact=f"Consumers checking for {old_success_code} will miss successful responses"
                         ))
         
         return changes
@@ -317,19 +538,73 @@ class BreakingChangeDetector:
                 'critical_count': 0
             }
         
-        by_severity = {}
-        by_category = {}
-        
-        for change in changes:
-            # Count by severity
-            by_severity[change.severity] = by_severity.get(change.severity, 0) + 1
-            
-            # Count by category
-            by_category[change.category] = by_category.get(change.category, 0) + 1
+        by_severity = Counter(change.severity for change in changes)
+        by_category = Counter(change.category for change in changes)
         
         return {
             'total': len(changes),
-            'by_severity': by_severity,
-            'by_category': by_category,
-            'critical_count': by_severity.get('critical', 0)
-        }
\ No newline at end of file
+            'by_severity': dict(by_severity),
+            'by_category': dict(by_category),
+            'critical_count': by_severity.get(SEVERITY_CRITICAL, 0)
+        }
+
+
+def _schema_location(keys: List[Any]) -> str:
+    """Format a DeepDiff key path as 'User.address.street'"""
+    return '.'.join(str(key) for key in keys if key != 'properties')
+
+
+def _schema_path(keys: List[Any]) -> str:
+    """Format a DeepDiff key path as 'schemas/User.address.street'"""
+    return 'schemas/' + _schema_location(keys)
+
+
+def _field_removed(keys: List[Any], old_field: Any) -> BreakingChange:
+    """field_removed change for the field at keys (..., 'properties', name)"""
+    field_name = keys[-1]
+    return BreakingChange(
+        category=CATEGORY_FIELD_REMOVED,
+        severity=SEVERITY_CRITICAL,
+        path=_schema_path(keys),
+        old_value=old_field,
+        new_value=None,
+        description=f"Field '{field_name}' removed from {_schema_location(keys[:-2])}",
+        impact=f"Consumers expecting '{field_name}' will fail"
+    )
+
+
+def _required_changed(keys: List[Any], field: str, old_required: List[str],
+                      new_required: List[str]) -> BreakingChange:
+    """
+    required_field_added/removed change for field in the required list at keys.
+    
+    Added when field is in new_required, removed otherwise.
+    """
+    schema_name = _schema_location(keys[:-1])
+    
+    if field in new_required:
+        return BreakingChange(
+            category=CATEGORY_REQUIRED_FIELD_ADDED,
+            severity=SEVERITY_HIGH,
+            path=_schema_path(keys),
+            old_value=old_required,
+            new_value=new_required,
+            description=f"Field '{field}' is now required in {schema_name}",
+            impact=f"Existing requests without '{field}' will fail validation"
+        )
+    
+    return BreakingChange(
+        category=CATEGORY_REQUIRED_FIELD_REMOVED,
+        severity=SEVERITY_MEDIUM,
+        path=_schema_path(keys),
+        old_value=old_required,
+        new_value=new_required,
+        description=f"Field '{field}' is no longer required in {schema_name}",
+        impact=f"Field is now optional (usually safe change)"
+    )
+
+
+def _run_pair(old_spec_path: str, new_spec_path: str) -> Tuple[Tuple[str, str], List[BreakingChange]]:
+    """Compare one spec pair (top-level so worker processes can unpickle it)"""
+    detector = BreakingChangeDetector(old_spec_path, new_spec_path)
+    return (old_spec_path, new_spec_path), detector.detect_all_changes()
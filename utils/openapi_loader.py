@@ -3,8 +3,29 @@ OpenAPI Specification Loader Utility
 Load and parse OpenAPI specs for testing
 """
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# libyaml-backed loader when available (much faster than pure Python)
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on path and file stat.
+    
+    mtime_ns and size are part of the cache key so an edited file is
+    parsed again. The returned dict is shared between callers and must
+    be treated as read-only.
+    """
+    # Raw bytes let libyaml handle decoding itself
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YAMLLoader)
 
 class OpenAPILoader:
     """
@@ -14,6 +35,7 @@ class OpenAPILoader:
         loader = OpenAPILoader('contracts/openapi-specs/users-api-v1.yaml')
         spec = loader.get_spec()
         schema = loader.get_schema('User')
+        resolved = loader.get_resolved_schema('User')  # $refs inlined
     """
     def __init__(self, spec_path: str):
         """
@@ -24,17 +46,24 @@ class OpenAPILoader:
         """
         self.spec_path = Path(spec_path)
         self._spec = None
+        self._resolved_schemas = {}
 
     def get_spec(self) -> Dict[str, Any]:
         """
         Load and return full OpenAPI spec.
         
+        Parsed specs are cached process-wide by file path and stat, so
+        loaders for the same unchanged file share one parse. Treat the
+        returned dict as read-only.
+        
         Returns:
             Dict containing full OpenAPI specification
         """
         if self._spec is None:
-            with open(self.spec_path, 'r') as f:
-                self._spec = yaml.safe_load(f)
+            st = self.spec_path.stat()
+            self._spec = _load_yaml_cached(
+                str(self.spec_path.resolve()), st.st_mtime_ns, st.st_size
+            )
         return self._spec
 
     def get_schema(self, schema_name: str) -> Dict[str, Any]:
@@ -147,4 +176,68 @@ class OpenAPILoader:
         ref = schema['$ref']
         schema_name = ref.split('/')[-1]
 
-        return self.get_schema(schema_name)
\ No newline at end of file
+        return self.get_schema(schema_name)
+
+    def get_resolved_schema(self, schema_name: str) -> Dict[str, Any]:
+        """
+        Get a schema from components/schemas with all $refs inlined.
+        
+        Each schema is resolved once per loader; later calls return
+        the cached result, so it can be validated without full_spec.
+        
+        Args:
+            schema_name: Name of schema (e.g., 'User', 'Error')
+            
+        Returns:
+            Schema definition dict without local $refs
+            
+        Raises:
+            KeyError: If schema not found
+            ValueError: If schema is recursive (validate it with full_spec instead)
+        """
+        if schema_name not in self._resolved_schemas:
+            self._resolved_schemas[schema_name] = self.resolve_refs(
+                self.get_schema(schema_name), (schema_name,)
+            )
+
+        return self._resolved_schemas[schema_name]
+
+    def resolve_refs(self, schema: Any, seen: Tuple[str, ...] = ()) -> Any:
+        """
+        Recursively replace $refs in schema with their definitions.
+        
+        Args:
+            schema: Schema (or any nested value) that may contain $refs
+            seen: Schema names already being expanded on this branch
+            
+        Returns:
+            Copy of schema with $refs inlined
+            
+        Raises:
+            KeyError: If a referenced schema is not found
+            ValueError: If a schema references itself (directly or through
+                other schemas); it cannot be inlined, so validate it with
+                full_spec instead
+        """
+        if isinstance(schema, list):
+            return [self.resolve_refs(item, seen) for item in schema]
+
+        if not isinstance(schema, dict):
+            return schema
+
+        # Follow $ref chains iteratively ('A' -> 'B' -> definition)
+        target = schema
+        while '$ref' in target:
+            schema_name = target['$ref'].split('/')[-1]
+
+            if schema_name in seen:
+                cycle = ' -> '.join(seen[seen.index(schema_name):] + (schema_name,))
+                raise ValueError(
+                    f"Schema '{schema_name}' is recursive ({cycle}) and cannot be "
+                    f"inlined; validate it with full_spec instead"
+                )
+
+            seen = seen + (schema_name,)
+            target = self.get_schema(schema_name)
+
+        return {key: self.resolve_refs(value, seen) for key, value in target.items()}
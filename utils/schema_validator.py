@@ -2,10 +2,137 @@
 JSON Schema Validator
 Validate API responses against OpenAPI schemas
 """
+import json
+import re
 import jsonschema
-from typing import Dict, Any, List, Tuple
+import fastjsonschema
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Tuple, Callable
 from jsonschema import Draft7Validator
 
+# RE2 (google-re2, optional) matches in linear time; fall back to stdlib re
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Patterns give the same result under re and RE2: inline (?i) instead of
+# re.IGNORECASE (RE2 has no flag arguments), [0-9] instead of \d (Unicode
+# digits in re, ASCII in RE2), and whitespace is rejected before matching
+# (see _format_match)
+_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_URI_PATTERN = (
+    r'(?i)^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})'  # IP
+    r'(?::[0-9]+)?'  # optional port
+    r'(?:/?|[/?]\S+)$')
+
+# Compiled once at import instead of on every call
+_EMAIL_RE = _re.compile(_EMAIL_PATTERN)
+_URI_RE = _re.compile(_URI_PATTERN)
+
+# Always stdlib re: Unicode whitespace, as str.isspace() defines it
+_WHITESPACE_RE = re.compile(r'\s')
+
+
+def _format_match(pattern: Any, value: str) -> bool:
+    """
+    Match value against a compiled format pattern.
+    
+    Values containing whitespace never match. This keeps results engine
+    independent: re's $ also matches before a trailing newline and its
+    non-space class excludes Unicode spaces, while RE2's do neither.
+    """
+    return _WHITESPACE_RE.search(value) is None and pattern.match(value) is not None
+
+
+@lru_cache(maxsize=256)
+def _compile_check(definition_json: str) -> Callable[[Any], List[str]]:
+    """
+    Compile a JSON schema string into a validator callable.
+    
+    Keyed on content, so equal schemas held in different objects share
+    one compiled validator and an edited schema is compiled again. The
+    callable validates against its own copy of the schema.
+    
+    Valid data goes through the fastjsonschema check only; invalid data
+    is re-validated with Draft7Validator to report every error instead
+    of only the first one.
+    """
+    definition = json.loads(definition_json)
+    # Formats are not enforced, matching Draft7Validator's defaults
+    fast_check = fastjsonschema.compile(definition, use_default=False, use_formats=False)
+
+    # Built on first failure only, then reused; local $refs resolve
+    # against the definition itself
+    draft7_validator = None
+
+    def check(data: Any) -> List[str]:
+        nonlocal draft7_validator
+        try:
+            fast_check(data)
+        except fastjsonschema.JsonSchemaException:
+            if draft7_validator is None:
+                draft7_validator = Draft7Validator(definition)
+            return SchemaValidator._collect_errors(draft7_validator, data)
+        return []
+
+    return check
+
+
+def _iter_dicts(schema: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every dict in schema, breadth-first.
+    
+    Callers stop at the first match, so shallow keywords are found
+    without descending into deeply nested sibling schemas.
+    """
+    pending = deque((schema,))
+    popleft, extend = pending.popleft, pending.extend
+    
+    while pending:
+        node = popleft()
+        if isinstance(node, dict):
+            yield node
+            extend(node.values())
+        elif isinstance(node, list):
+            extend(node)
+
+
+def _has_ref(schema: Any) -> bool:
+    """Return True if schema contains a $ref key at any depth"""
+    return any('$ref' in node for node in _iter_dicts(schema))
+
+
+def _has_number(value: Any) -> bool:
+    """Return True if value is, or contains, a number or boolean"""
+    if isinstance(value, (bool, int, float)):
+        return True
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return False
+    return any(_has_number(item) for item in value)
+
+
+def _has_numeric_enum(schema: Any) -> bool:
+    """
+    Return True if an enum or const in schema holds a number or boolean.
+    
+    Python compares True == 1 and False == 0, so fastjsonschema accepts
+    booleans for such values (and numbers for boolean ones) where
+    Draft7Validator rejects them.
+    """
+    return any(
+        ('enum' in node and _has_number(node['enum']))
+        or ('const' in node and _has_number(node['const']))
+        for node in _iter_dicts(schema)
+    )
+
+
 class SchemaValidator:
     """
     Validate JSON data against schemas.
@@ -15,7 +142,17 @@ class SchemaValidator:
         errors = validator.validate(data, schema)
         if errors:
             print(f"Validation failed: {errors}")
+
+        # Compile once, validate many
+        check = validator.compile(schema)
+        for item in items:
+            errors = check(item)
     """
+    # RefResolvers shared by all instances, least recently used first:
+    # id(full_spec) -> (full_spec, resolver)
+    _RESOLVER_CACHE_SIZE = 8
+    _resolvers: 'OrderedDict[int, Tuple[Any, Any]]' = OrderedDict()
+
     def __init__(self):
         """Initialize validator."""
         pass
@@ -24,6 +161,10 @@ class SchemaValidator:
              full_spec: Dict[str, Any] = None) -> List[str]:
         """
         Validate data against JSON schema.
+        
+        Uses Draft7Validator directly: generating code for a one-off
+        validation costs more than it saves. Use compile() to validate
+        many items against one schema.
     
         Args:
             data: Data to validate (dict, list, etc.)
@@ -33,23 +174,118 @@ class SchemaValidator:
         Returns:
             List of error messages (empty if valid)
         """
-        # If we have a full spec with $refs, use RefResolver
-        if full_spec and '$ref' in str(schema):
+        uses_refs = bool(full_spec) and _has_ref(schema)
+        validator = self._draft7_validator(schema, full_spec if uses_refs else None)
+        return self._collect_errors(validator, data)
+
+    def compile(self, schema: Dict[str, Any],
+                full_spec: Dict[str, Any] = None) -> Callable[[Any], List[str]]:
+        """
+        Compile schema into a reusable validator.
+        
+        Schemas are compiled with fastjsonschema and cached by content, so
+        equal schemas (from any SchemaValidator instance) share compiled
+        code. The returned callable is frozen: it keeps validating against
+        the schema as it was when compiled, so compile again after editing
+        a schema in place.
+        
+        Schemas with numeric or boolean enum/const values are validated by
+        Draft7Validator alone, since fastjsonschema cannot tell True from 1
+        there, as are schemas fastjsonschema cannot compile (e.g. $refs
+        outside components).
+        
+        Args:
+            schema: JSON Schema definition
+            full_spec: Full OpenAPI spec (needed for $ref resolution)
+            
+        Returns:
+            Callable taking data and returning a list of error messages
+        """
+        uses_refs = bool(full_spec) and _has_ref(schema)
+
+        definition = schema
+        if uses_refs:
+            # fastjsonschema resolves local $refs against the root document
+            definition = dict(schema, components=full_spec.get('components', {}))
+
+        if _has_numeric_enum(definition):
+            return self._draft7_check(schema, full_spec if uses_refs else None)
+
+        try:
+            # Key order is kept: it sets the order Draft7 reports errors in.
+            # Non-JSON values (e.g. YAML dates in examples) are keyed by their text
+            return _compile_check(json.dumps(definition, default=str))
+        except fastjsonschema.JsonSchemaDefinitionException:
+            # Only components are copied into the definition; $refs to other
+            # parts of full_spec (e.g. '#/paths/...') need RefResolver
+            return self._draft7_check(schema, full_spec)
+
+    @classmethod
+    def _draft7_check(cls, schema: Dict[str, Any],
+                      full_spec: Dict[str, Any] = None) -> Callable[[Any], List[str]]:
+        """
+        Build validator callable that uses Draft7Validator only.
+        
+        Args:
+            schema: JSON Schema definition
+            full_spec: Full OpenAPI spec to resolve $refs against (optional)
+            
+        Returns:
+            Callable taking data and returning a list of error messages
+        """
+        validator = cls._draft7_validator(schema, full_spec)
+        return lambda data: cls._collect_errors(validator, data)
+
+    @classmethod
+    def _draft7_validator(cls, schema: Dict[str, Any],
+                          full_spec: Dict[str, Any] = None) -> Draft7Validator:
+        """
+        Build Draft7Validator, reusing one RefResolver per full spec.
+        
+        Args:
+            schema: JSON Schema definition
+            full_spec: Full OpenAPI spec to resolve $refs against (optional)
+            
+        Returns:
+            Draft7Validator for schema
+        """
+        if full_spec is None:
+            return Draft7Validator(schema)
+
+        cached = cls._resolvers.get(id(full_spec))
+
+        if cached is None:
             from jsonschema import RefResolver
         
             # Create resolver with full spec
-            resolver = RefResolver.from_schema(full_spec)
-            validator = Draft7Validator(schema, resolver=resolver)
+            cached = (full_spec, RefResolver.from_schema(full_spec))
+            cls._resolvers[id(full_spec)] = cached
+            if len(cls._resolvers) > cls._RESOLVER_CACHE_SIZE:
+                cls._resolvers.popitem(last=False)
         else:
-            validator = Draft7Validator(schema)
-    
+            cls._resolvers.move_to_end(id(full_spec))
+
+        return Draft7Validator(schema, resolver=cached[1])
+
+    @staticmethod
+    def _collect_errors(validator: Draft7Validator, data: Any) -> List[str]:
+        """
+        Collect all validation errors reported by validator.
+        
+        Args:
+            validator: Draft7Validator to run
+            data: Data to validate
+            
+        Returns:
+            List of error messages (empty if valid)
+        """
         errors = []
+        append = errors.append
     
         for error in validator.iter_errors(data):
             # Format error message
-            path = ' -> '.join(str(p) for p in error.path) if error.path else 'root'
-            message = f"{path}: {error.message}"
-            errors.append(message)
+            path = ' -> '.join(map(str, error.path)) if error.path else 'root'
+            append(f"{path}: {error.message}")
     
         return errors
     
@@ -111,11 +347,7 @@ class SchemaValidator:
         Returns:
             True if valid email format
         """
-        import re
-        email_pattern = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
-        return bool(email_pattern.match(email))
+        return bool(email) and _format_match(_EMAIL_RE, email)
 
     def validate_format(self, value: Any, format_type: str) -> bool:
         """
@@ -132,15 +364,7 @@ class SchemaValidator:
             return self.validate_email_format(str(value))
         
         elif format_type == 'uri':
-            import re
-            uri_pattern = re.compile(
-                r'^https?://'  # http:// or https://
-                r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-                r'localhost|'  # localhost
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-                r'(?::\d+)?'  # optional port
-                r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-            return bool(uri_pattern.match(str(value)))
+            return _format_match(_URI_RE, str(value))
         
         # Add more format validators as needed
         return True